@@ -0,0 +1,248 @@
+"""Structural diffs between consecutive serialized daily briefings."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, Sequence
+
+VOLATILE_KEYS = frozenset({"generated_at", "cached_at", "version_id"})
+
+
+@dataclass(frozen=True)
+class CollectionDiff:
+    added: tuple[dict[str, Any], ...]
+    removed: tuple[str, ...]
+    changed: tuple[dict[str, Any], ...]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "added": list(self.added),
+            "removed": list(self.removed),
+            "changed": list(self.changed),
+        }
+
+
+@dataclass(frozen=True)
+class TaskFlip:
+    card_id: str
+    task_id: str
+    completed: bool
+
+
+@dataclass(frozen=True)
+class ContactStatusChange:
+    person_id: str
+    activity: str
+    previous_status: str
+    status: str
+
+
+@dataclass(frozen=True)
+class BriefingDiff:
+    from_version: str
+    to_version: str
+    target_date: str | None
+    focus_cards: CollectionDiff
+    overdue_cards: CollectionDiff
+    task_flips: tuple[TaskFlip, ...]
+    contacts: CollectionDiff
+    contact_status_changes: tuple[ContactStatusChange, ...]
+    stats_deltas: dict[str, float]
+    recommendations: tuple[str, ...] | None
+    xp_deltas: dict[str, float]
+    integrity: dict[str, Any] | None
+
+    @property
+    def is_empty(self) -> bool:
+        # derived from the content, so a change the diff does not model never looks non-empty
+        return not (
+            self.target_date is not None
+            or not self.focus_cards.is_empty
+            or not self.overdue_cards.is_empty
+            or self.task_flips
+            or not self.contacts.is_empty
+            or self.contact_status_changes
+            or self.stats_deltas
+            or self.recommendations is not None
+            or self.xp_deltas
+            or self.integrity is not None
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "from_version": self.from_version,
+            "to_version": self.to_version,
+            "target_date": self.target_date,
+            "focus_cards": self.focus_cards.to_dict(),
+            "overdue_cards": self.overdue_cards.to_dict(),
+            "task_flips": [
+                {"card_id": flip.card_id, "task_id": flip.task_id, "completed": flip.completed}
+                for flip in self.task_flips
+            ],
+            "contacts": self.contacts.to_dict(),
+            "contact_status_changes": [
+                {
+                    "person_id": change.person_id,
+                    "activity": change.activity,
+                    "previous_status": change.previous_status,
+                    "status": change.status,
+                }
+                for change in self.contact_status_changes
+            ],
+            "stats_deltas": dict(self.stats_deltas),
+            "recommendations": (
+                list(self.recommendations) if self.recommendations is not None else None
+            ),
+            "xp_deltas": dict(self.xp_deltas),
+            "integrity": self.integrity,
+        }
+
+
+def briefing_version(payload: Mapping[str, Any]) -> str:
+    """Content hash of a serialized briefing, ignoring timestamps."""
+
+    stable = {key: value for key, value in payload.items() if key not in VOLATILE_KEYS}
+    encoded = json.dumps(stable, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def diff_briefings(previous: Mapping[str, Any], current: Mapping[str, Any]) -> BriefingDiff:
+    """Compare two ``DailyOperationsBriefing.to_dict`` payloads."""
+
+    old_household = previous.get("household", {})
+    new_household = current.get("household", {})
+    old_contacts = previous.get("human_contacts", {})
+    new_contacts = current.get("human_contacts", {})
+
+    old_focus = _index(old_household.get("focus_cards", ()), _card_key)
+    new_focus = _index(new_household.get("focus_cards", ()), _card_key)
+    old_overdue = _index(old_household.get("overdue_cards", ()), _card_key)
+    new_overdue = _index(new_household.get("overdue_cards", ()), _card_key)
+    old_people = _index(_contact_statuses(old_contacts), _contact_key)
+    new_people = _index(_contact_statuses(new_contacts), _contact_key)
+
+    stats_deltas = _numeric_deltas(old_household.get("stats", {}), new_household.get("stats", {}))
+    stats_deltas.update(
+        {
+            f"contacts.{key}": delta
+            for key, delta in _numeric_deltas(
+                old_contacts.get("summary", {}), new_contacts.get("summary", {})
+            ).items()
+        }
+    )
+
+    old_recommendations = old_household.get("recommendations", [])
+    new_recommendations = new_household.get("recommendations", [])
+    new_integrity = current.get("integrity")
+    new_date = current.get("target_date")
+
+    return BriefingDiff(
+        from_version=previous.get("version_id") or briefing_version(previous),
+        to_version=current.get("version_id") or briefing_version(current),
+        target_date=new_date if new_date != previous.get("target_date") else None,
+        focus_cards=_collection_diff(old_focus, new_focus),
+        overdue_cards=_collection_diff(old_overdue, new_overdue),
+        task_flips=_task_flips({**old_overdue, **old_focus}, {**new_overdue, **new_focus}),
+        contacts=_collection_diff(old_people, new_people),
+        contact_status_changes=_status_changes(old_people, new_people),
+        stats_deltas=stats_deltas,
+        recommendations=(
+            tuple(new_recommendations) if new_recommendations != old_recommendations else None
+        ),
+        xp_deltas=_numeric_deltas(
+            _xp_values(previous.get("xp")), _xp_values(current.get("xp"))
+        ),
+        # the section is bounded, so a change ships it whole like the recommendations
+        integrity=new_integrity if new_integrity != previous.get("integrity") else None,
+    )
+
+
+def _card_key(card: Mapping[str, Any]) -> str:
+    return str(card["card_id"])
+
+
+def _contact_key(status: Mapping[str, Any]) -> str:
+    return f"{status['person_id']}:{status['activity']}"
+
+
+def _index(
+    items: Sequence[Mapping[str, Any]], key: Callable[[Mapping[str, Any]], str]
+) -> dict[str, Mapping[str, Any]]:
+    return {key(item): item for item in items}
+
+
+def _contact_statuses(radar: Mapping[str, Any]) -> list[Mapping[str, Any]]:
+    return [
+        *radar.get("overdue", ()),
+        *radar.get("due_today", ()),
+        *radar.get("upcoming", ()),
+    ]
+
+
+def _collection_diff(
+    old: Mapping[str, Mapping[str, Any]], new: Mapping[str, Mapping[str, Any]]
+) -> CollectionDiff:
+    added = tuple(dict(item) for key, item in new.items() if key not in old)
+    removed = tuple(key for key in old if key not in new)
+    changed = tuple(dict(item) for key, item in new.items() if key in old and old[key] != item)
+    return CollectionDiff(added=added, removed=removed, changed=changed)
+
+
+def _task_flips(
+    old_cards: Mapping[str, Mapping[str, Any]], new_cards: Mapping[str, Mapping[str, Any]]
+) -> tuple[TaskFlip, ...]:
+    flips: list[TaskFlip] = []
+    for card_id, card in new_cards.items():
+        previous = old_cards.get(card_id)
+        if previous is None:
+            continue
+        before = {task["task_id"]: task["completed"] for task in previous.get("tasks", ())}
+        for task in card.get("tasks", ()):
+            completed = before.get(task["task_id"])
+            if completed is not None and completed != task["completed"]:
+                flips.append(
+                    TaskFlip(card_id=card_id, task_id=task["task_id"], completed=task["completed"])
+                )
+    return tuple(flips)
+
+
+def _status_changes(
+    old: Mapping[str, Mapping[str, Any]], new: Mapping[str, Mapping[str, Any]]
+) -> tuple[ContactStatusChange, ...]:
+    changes: list[ContactStatusChange] = []
+    for key, status in new.items():
+        previous = old.get(key)
+        if previous is not None and previous["status"] != status["status"]:
+            changes.append(
+                ContactStatusChange(
+                    person_id=status["person_id"],
+                    activity=status["activity"],
+                    previous_status=previous["status"],
+                    status=status["status"],
+                )
+            )
+    return tuple(changes)
+
+
+def _xp_values(xp: Mapping[str, Any] | None) -> dict[str, Any]:
+    # flatten area totals next to the scores and streaks so one delta pass covers both
+    if not xp:
+        return {}
+    values = {key: value for key, value in xp.items() if key != "area_totals"}
+    values.update({f"area.{area}": total for area, total in xp.get("area_totals", {}).items()})
+    return values
+
+
+def _numeric_deltas(old: Mapping[str, Any], new: Mapping[str, Any]) -> dict[str, float]:
+    deltas: dict[str, float] = {}
+    for key, value in new.items():
+        before = old.get(key, 0)
+        if isinstance(value, (int, float)) and value != before:
+            deltas[key] = value - before
+    return deltas
@@ -2,19 +2,49 @@
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
-from typing import Any
+from typing import Any, Sequence
 
-from dais_system.common.models import HouseholdStore, HumanContactStore
-from dais_system.io.json_store import load_household_store, load_human_contact_store
+from dais_system.agents.changefeed import BriefingDiff, briefing_version, diff_briefings
+from dais_system.common.index import (
+    IntegrityReport,
+    build_contact_index,
+    build_household_index,
+)
+from dais_system.common.models import HouseholdStore, HumanContactStore, ProgramRun, ProgramStore
+from dais_system.io.briefing_cache import (
+    BriefingCache,
+    briefing_cache_key,
+    file_fingerprint,
+    store_fingerprint,
+)
+from dais_system.io.json_store import (
+    HOUSEHOLD_STORE_PATH,
+    HUMAN_CONTACT_STORE_PATH,
+    PROGRAM_STORE_PATH,
+    load_household_store,
+    load_human_contact_store,
+    load_program_store,
+)
 from dais_system.pipelines.household import (
+    DEFAULT_STALE_AFTER_DAYS,
     CardBriefing,
     DailyBriefing as HouseholdDailyBriefing,
     build_daily_briefing,
 )
 from dais_system.pipelines.human_contact import ContactRadar, ContactStatus, build_contact_radar
+from dais_system.pipelines.programs import XpLedger, XpSummary
+
+BRIEFING_HISTORY_SIZE = 16
+# the briefing carries counts plus this many examples; the full report stays on the agent
+INTEGRITY_SAMPLE_SIZE = 10
+# bump whenever the briefing payload layout changes so stale cache entries are ignored
+BRIEFING_SCHEMA_VERSION = 3
 
 
 @dataclass(frozen=True)
@@ -23,40 +53,199 @@ class DailyOperationsBriefing:
     target_date: date
     household: HouseholdDailyBriefing
     human_contacts: ContactRadar
+    xp: XpSummary | None = None
+    integrity: IntegrityReport | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        payload = {
             "generated_at": self.generated_at.isoformat(),
             "target_date": self.target_date.isoformat(),
             "household": _serialize_household(self.household),
             "human_contacts": _serialize_contacts(self.human_contacts),
+            "xp": _serialize_xp(self.xp) if self.xp else None,
+            "integrity": _serialize_integrity(self.integrity) if self.integrity else None,
         }
+        payload["version_id"] = briefing_version(payload)
+        return payload
 
 
 class DailyOperationsAgent:
     """Loads persistent stores and generates daily reports."""
 
-    def __init__(self, household_store: HouseholdStore, contact_store: HumanContactStore) -> None:
+    def __init__(
+        self,
+        household_store: HouseholdStore,
+        contact_store: HumanContactStore,
+        program_store: ProgramStore | None = None,
+        *,
+        cache: BriefingCache | None = None,
+        fingerprints: Sequence[str] | None = None,
+    ) -> None:
         self._household_store = household_store
         self._contact_store = contact_store
+        self._household_index = build_household_index(household_store)
+        self._contact_index = build_contact_index(contact_store)
+        self._program_store = program_store
+        self._xp_ledger = XpLedger.from_store(program_store) if program_store else None
+        self._history: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # cache hits are kept as raw text and only parsed when a diff needs them
+        self._unparsed: deque[str] = deque(maxlen=BRIEFING_HISTORY_SIZE)
+        self._cache = cache
+        # source file fingerprints; in-memory stores are hashed on first cache use instead
+        self._fingerprints = list(fingerprints) if fingerprints is not None else None
 
     @classmethod
-    def from_assets(cls) -> "DailyOperationsAgent":
-        return cls(load_household_store(), load_human_contact_store())
+    def from_assets(cls, *, cache: BriefingCache | None = None) -> "DailyOperationsAgent":
+        # fingerprint before loading: a write during the load then only causes a miss
+        fingerprints = asset_fingerprints()
+        program_store = (
+            load_program_store(PROGRAM_STORE_PATH) if PROGRAM_STORE_PATH.exists() else None
+        )
+        return cls(
+            load_household_store(HOUSEHOLD_STORE_PATH),
+            load_human_contact_store(HUMAN_CONTACT_STORE_PATH),
+            program_store,
+            cache=cache,
+            fingerprints=fingerprints,
+        )
+
+    @property
+    def integrity_report(self) -> IntegrityReport:
+        return self._household_index.report.merge(self._contact_index.report)
+
+    def record_program_run(self, run: ProgramRun) -> int:
+        """Fold a new run into the XP aggregates without rebuilding them."""
+
+        if self._xp_ledger is None:
+            raise RuntimeError("Agent was created without a program store")
+        if self._cache is not None:
+            # chain the run into the program fingerprint so cached briefings go stale
+            fingerprints = self._store_fingerprints()
+            chained = f"{fingerprints[-1]}:{run!r}".encode("utf-8")
+            fingerprints[-1] = hashlib.sha256(chained).hexdigest()
+        return self._xp_ledger.add_run(run)
 
     def generate_briefing(self, for_date: date | None = None) -> DailyOperationsBriefing:
         target = for_date or date.today()
-        household = build_daily_briefing(self._household_store, target)
-        contact_radar = build_contact_radar(self._contact_store, target)
+        household = build_daily_briefing(
+            self._household_store, target, index=self._household_index
+        )
+        contact_radar = build_contact_radar(self._contact_store, target, index=self._contact_index)
         return DailyOperationsBriefing(
             generated_at=datetime.now(tz=timezone.utc),
             target_date=target,
             household=household,
             human_contacts=contact_radar,
+            xp=self._xp_ledger.summary(target) if self._xp_ledger else None,
+            integrity=self.integrity_report,
         )
 
     def generate_briefing_json(self, for_date: date | None = None) -> str:
-        return json.dumps(self.generate_briefing(for_date).to_dict(), indent=2, sort_keys=True)
+        if self._cache is None:
+            payload = self._remember(self.generate_briefing(for_date).to_dict())
+            return json.dumps(payload, indent=2, sort_keys=True)
+
+        target = for_date or date.today()
+        key = briefing_cache_key(self._store_fingerprints(), target, _cache_settings())
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._unparsed.append(cached)
+            return cached
+
+        payload = self.generate_briefing(target).to_dict()
+        payload["cached_at"] = datetime.now(tz=timezone.utc).isoformat()
+        text = json.dumps(self._remember(payload), indent=2, sort_keys=True)
+        self._cache.put(key, text)
+        # also by version, so a later process can diff against what this one served
+        self._cache.put(_version_key(payload["version_id"]), text)
+        return text
+
+    def generate_briefing_diff(
+        self, since_version: str, for_date: date | None = None
+    ) -> BriefingDiff | None:
+        """Diff the current briefing against a previously served version.
+
+        Served versions are looked up in this agent's history and, with a cache,
+        in the versions persisted there by earlier processes. Returns ``None``
+        when the version is unknown so the caller can fall back to fetching the
+        full briefing.
+        """
+
+        previous = self._served_payload(since_version)
+        if previous is None:
+            return None
+        current = self._remember(self.generate_briefing(for_date).to_dict())
+        if self._cache is not None and current["version_id"] != since_version:
+            text = json.dumps(current, indent=2, sort_keys=True)
+            self._cache.put(_version_key(current["version_id"]), text)
+        return diff_briefings(previous, current)
+
+    def _served_payload(self, version: str) -> dict[str, Any] | None:
+        previous = self._history.get(version)
+        while previous is None and self._unparsed:
+            self._remember(json.loads(self._unparsed.popleft()))
+            previous = self._history.get(version)
+        if previous is None and self._cache is not None:
+            persisted = self._cache.get(_version_key(version))
+            if persisted is not None:
+                previous = self._remember(json.loads(persisted))
+        return previous
+
+    def _store_fingerprints(self) -> list[str]:
+        if self._fingerprints is None:
+            self._fingerprints = [
+                store_fingerprint(self._household_store),
+                store_fingerprint(self._contact_store),
+                store_fingerprint(self._program_store),
+            ]
+        return self._fingerprints
+
+    def _remember(self, payload: dict[str, Any]) -> dict[str, Any]:
+        version = payload["version_id"]
+        self._history[version] = payload
+        self._history.move_to_end(version)
+        while len(self._history) > BRIEFING_HISTORY_SIZE:
+            self._history.popitem(last=False)
+        return payload
+
+
+def asset_fingerprints() -> list[str]:
+    return [
+        file_fingerprint(HOUSEHOLD_STORE_PATH),
+        file_fingerprint(HUMAN_CONTACT_STORE_PATH),
+        file_fingerprint(PROGRAM_STORE_PATH),
+    ]
+
+
+def cached_briefing_json(cache: BriefingCache, for_date: date | None = None) -> str:
+    """Serve the asset briefing from the cache; the stores are only loaded on a miss."""
+
+    target = for_date or date.today()
+    cached = cache.get(briefing_cache_key(asset_fingerprints(), target, _cache_settings()))
+    if cached is not None:
+        return cached
+    return DailyOperationsAgent.from_assets(cache=cache).generate_briefing_json(target)
+
+
+def cached_briefing_diff(
+    cache: BriefingCache, since_version: str, for_date: date | None = None
+) -> BriefingDiff | None:
+    """Diff the asset briefing against a version served by any earlier process."""
+
+    return DailyOperationsAgent.from_assets(cache=cache).generate_briefing_diff(
+        since_version, for_date
+    )
+
+
+def _version_key(version_id: str) -> str:
+    return f"version-{version_id}"
+
+
+def _cache_settings() -> dict[str, Any]:
+    return {
+        "schema": BRIEFING_SCHEMA_VERSION,
+        "stale_after_days": DEFAULT_STALE_AFTER_DAYS,
+    }
 
 
 def _serialize_household(briefing: HouseholdDailyBriefing) -> dict[str, Any]:
@@ -118,9 +307,53 @@ def _serialize_contact(status: ContactStatus) -> dict[str, Any]:
     }
 
 
-def main() -> None:
-    agent = DailyOperationsAgent.from_assets()
-    print(agent.generate_briefing_json())
+def _serialize_xp(summary: XpSummary) -> dict[str, Any]:
+    return {
+        "area_totals": dict(summary.area_totals),
+        "total_xp": summary.total_xp,
+        "daily_score": summary.daily_score,
+        "weekly_score": summary.weekly_score,
+        "current_streak_days": summary.current_streak_days,
+        "longest_streak_days": summary.longest_streak_days,
+        "total_runs": summary.total_runs,
+        "rewarded_runs": summary.rewarded_runs,
+    }
+
+
+def _serialize_integrity(report: IntegrityReport) -> dict[str, Any]:
+    sample = INTEGRITY_SAMPLE_SIZE
+    return {
+        "is_clean": report.is_clean,
+        "dangling_reference_count": len(report.dangling_references),
+        "orphaned_entry_count": len(report.orphaned_entry_ids),
+        "orphaned_log_count": len(report.orphaned_log_ids),
+        "dangling_references": [
+            {
+                "source": ref.source,
+                "source_id": ref.source_id,
+                "field": ref.field,
+                "missing_id": ref.missing_id,
+            }
+            for ref in report.dangling_references[:sample]
+        ],
+        "orphaned_entry_ids": list(report.orphaned_entry_ids[:sample]),
+        "orphaned_log_ids": list(report.orphaned_log_ids[:sample]),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Print the DAiS daily briefing.")
+    parser.add_argument("--since", metavar="VERSION_ID", help="Print a diff against this version")
+    args = parser.parse_args(argv)
+
+    cache = BriefingCache()
+    if args.since:
+        diff = cached_briefing_diff(cache, args.since)
+        if diff is not None:
+            print(json.dumps(diff.to_dict(), indent=2, sort_keys=True))
+            return
+    # unknown version: the client falls back to the full briefing
+    print(cached_briefing_json(cache))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+"""Referential indexes over the stores, built once and shared by the pipelines."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping
+
+from dais_system.common.models import (
+    ContactLog,
+    HouseholdCard,
+    HouseholdEntry,
+    HouseholdStore,
+    HumanContactStore,
+    Person,
+    Task,
+)
+
+
+@dataclass(frozen=True)
+class DanglingReference:
+    source: str
+    source_id: str
+    field: str
+    missing_id: str
+
+
+@dataclass(frozen=True)
+class IntegrityReport:
+    dangling_references: tuple[DanglingReference, ...]
+    orphaned_entry_ids: tuple[str, ...]
+    orphaned_log_ids: tuple[str, ...]
+
+    @property
+    def is_clean(self) -> bool:
+        return not (self.dangling_references or self.orphaned_entry_ids or self.orphaned_log_ids)
+
+    def merge(self, other: "IntegrityReport") -> "IntegrityReport":
+        return IntegrityReport(
+            dangling_references=self.dangling_references + other.dangling_references,
+            orphaned_entry_ids=self.orphaned_entry_ids + other.orphaned_entry_ids,
+            orphaned_log_ids=self.orphaned_log_ids + other.orphaned_log_ids,
+        )
+
+
+@dataclass(frozen=True)
+class HouseholdIndex:
+    tasks_by_id: Mapping[str, Task]
+    cards_by_id: Mapping[str, HouseholdCard]
+    card_tasks: Mapping[str, tuple[Task, ...]]
+    entry_cards: Mapping[str, HouseholdCard]
+    latest_entries: Mapping[str, HouseholdEntry]
+    report: IntegrityReport
+
+    def tasks_for_card(self, card_id: str) -> tuple[Task, ...]:
+        return self.card_tasks.get(card_id, ())
+
+    def latest_entry_for_card(self, card_id: str) -> HouseholdEntry | None:
+        return self.latest_entries.get(card_id)
+
+
+@dataclass(frozen=True)
+class ContactIndex:
+    persons_by_id: Mapping[str, Person]
+    assignment_persons: Mapping[str, Person]
+    latest_logs: Mapping[tuple[str, str], ContactLog]
+    report: IntegrityReport
+
+    def latest_log_for(self, person_id: str, activity: str) -> ContactLog | None:
+        return self.latest_logs.get((person_id, activity))
+
+
+def build_household_index(store: HouseholdStore) -> HouseholdIndex:
+    """Resolve card -> tasks and entry -> card in a single pass over the store."""
+
+    tasks_by_id = store.task_lookup()
+    cards_by_id = {card.id: card for card in store.cards}
+    dangling: list[DanglingReference] = []
+
+    card_tasks: dict[str, tuple[Task, ...]] = {}
+    for card in store.cards:
+        resolved: list[Task] = []
+        for task_id in card.task_ids:
+            task = tasks_by_id.get(task_id)
+            if task is None:
+                dangling.append(DanglingReference("card", card.id, "task_ids", task_id))
+            else:
+                resolved.append(task)
+        card_tasks[card.id] = tuple(resolved)
+
+    entry_cards: dict[str, HouseholdCard] = {}
+    orphaned_entries: list[str] = []
+    prebuilt = store.latest_entries
+    latest: dict[str, HouseholdEntry] = {}
+    for entry in store.entries:
+        card = cards_by_id.get(entry.card_id)
+        if card is None:
+            orphaned_entries.append(entry.id)
+        else:
+            entry_cards[entry.id] = card
+        for task_id in entry.completed_task_ids:
+            if task_id not in tasks_by_id and not _snapshot_resolves(entry, task_id):
+                dangling.append(
+                    DanglingReference("entry", entry.id, "completed_task_ids", task_id)
+                )
+        if prebuilt is None:
+            current = latest.get(entry.card_id)
+            if current is None or entry.created_at > current.created_at:
+                latest[entry.card_id] = entry
+
+    return HouseholdIndex(
+        tasks_by_id=tasks_by_id,
+        cards_by_id=cards_by_id,
+        card_tasks=card_tasks,
+        entry_cards=entry_cards,
+        latest_entries=prebuilt if prebuilt is not None else latest,
+        report=IntegrityReport(
+            dangling_references=tuple(dangling),
+            orphaned_entry_ids=tuple(orphaned_entries),
+            orphaned_log_ids=(),
+        ),
+    )
+
+
+def _snapshot_resolves(entry: HouseholdEntry, task_id: str) -> bool:
+    # deleting a task keeps it in old entries; their card snapshot still carries its label
+    snapshot = entry.card_snapshot
+    return snapshot is not None and any(task.id == task_id for task in snapshot.tasks)
+
+
+def build_contact_index(store: HumanContactStore) -> ContactIndex:
+    """Resolve assignment -> person and the latest log per activity in one pass."""
+
+    persons_by_id = store.person_lookup()
+    dangling: list[DanglingReference] = []
+
+    assignment_persons: dict[str, Person] = {}
+    for assignment in store.assignments:
+        person = persons_by_id.get(assignment.person_id)
+        if person is None:
+            dangling.append(
+                DanglingReference("assignment", assignment.id, "person_id", assignment.person_id)
+            )
+        else:
+            assignment_persons[assignment.id] = person
+
+    orphaned_logs: list[str] = []
+    prebuilt = store.latest_logs
+    latest: dict[tuple[str, str], ContactLog] = {}
+    for log in store.logs:
+        if log.person_id not in persons_by_id:
+            orphaned_logs.append(log.id)
+        if prebuilt is None:
+            key = (log.person_id, log.activity)
+            current = latest.get(key)
+            if current is None or log.created_at > current.created_at:
+                latest[key] = log
+
+    return ContactIndex(
+        persons_by_id=persons_by_id,
+        assignment_persons=assignment_persons,
+        latest_logs=prebuilt if prebuilt is not None else latest,
+        report=IntegrityReport(
+            dangling_references=tuple(dangling),
+            orphaned_entry_ids=(),
+            orphaned_log_ids=tuple(orphaned_logs),
+        ),
+    )
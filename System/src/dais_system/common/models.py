@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from typing import Any, Iterable, Mapping, Sequence
 
@@ -140,6 +140,11 @@ class HouseholdStore:
     tasks: tuple[Task, ...]
     cards: tuple[HouseholdCard, ...]
     entries: tuple[HouseholdEntry, ...]
+    # optional card_id -> latest entry index, prebuilt by loaders that already walk the entries;
+    # not an init field, so ``replace`` drops it instead of copying a stale index
+    latest_entries: Mapping[str, HouseholdEntry] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "HouseholdStore":
@@ -150,10 +155,17 @@ class HouseholdStore:
             entries=tuple(HouseholdEntry.from_dict(item) for item in data.get("entries", ())),
         )
 
+    def with_latest_entries(self, latest: Mapping[str, HouseholdEntry]) -> "HouseholdStore":
+        indexed = replace(self)
+        object.__setattr__(indexed, "latest_entries", latest)
+        return indexed
+
     def cards_for_weekday(self, weekday: int) -> tuple[HouseholdCard, ...]:
         return tuple(card for card in self.cards if card.weekday == weekday)
 
     def latest_entry_for_card(self, card_id: str) -> HouseholdEntry | None:
+        if self.latest_entries is not None:
+            return self.latest_entries.get(card_id)
         matches = [entry for entry in self.entries if entry.card_id == card_id]
         return max(matches, key=lambda entry: entry.created_at, default=None)
 
@@ -228,6 +240,10 @@ class HumanContactStore:
     persons: tuple[Person, ...]
     assignments: tuple[ContactAssignment, ...]
     logs: tuple[ContactLog, ...]
+    # optional (person_id, activity) -> latest log index, see HouseholdStore.latest_entries
+    latest_logs: Mapping[tuple[str, str], ContactLog] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "HumanContactStore":
@@ -240,12 +256,124 @@ class HumanContactStore:
             logs=tuple(ContactLog.from_dict(item) for item in data.get("logs", ())),
         )
 
+    def with_latest_logs(
+        self, latest: Mapping[tuple[str, str], ContactLog]
+    ) -> "HumanContactStore":
+        indexed = replace(self)
+        object.__setattr__(indexed, "latest_logs", latest)
+        return indexed
+
     def person_lookup(self) -> dict[str, Person]:
         return {person.id: person for person in self.persons}
 
     def latest_log_for(self, person_id: str, activity: str) -> ContactLog | None:
+        if self.latest_logs is not None:
+            return self.latest_logs.get((person_id, activity))
         candidates = [
             log for log in self.logs if log.person_id == person_id and log.activity == activity
         ]
         return max(candidates, key=lambda log: log.created_at, default=None)
 
+    def latest_log_index(self) -> dict[tuple[str, str], ContactLog]:
+        if self.latest_logs is not None:
+            return dict(self.latest_logs)
+        index: dict[tuple[str, str], ContactLog] = {}
+        for log in self.logs:
+            key = (log.person_id, log.activity)
+            current = index.get(key)
+            if current is None or log.created_at > current.created_at:
+                index[key] = log
+        return index
+
+
+@dataclass(frozen=True)
+class ProgramXpRules:
+    base_value: int
+    require_completion: bool
+    min_quality_score: float | None
+    require_custom_rule: bool
+    distribution: tuple[tuple[str, int], ...]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ProgramXpRules":
+        conditions = data.get("xpConditions") or {}
+        min_quality = data.get("minQualityScore")
+        distribution = data.get("xpDistribution") or {}
+        return cls(
+            base_value=int(data.get("xpBaseValue", 0)),
+            require_completion=bool(conditions.get("isComplete", False)),
+            min_quality_score=(
+                float(min_quality)
+                if min_quality is not None and conditions.get("minQualityMet", True)
+                else None
+            ),
+            require_custom_rule=bool(conditions.get("customRulePassed", False)),
+            distribution=tuple(
+                (str(area), int(percentage)) for area, percentage in distribution.items()
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class Program:
+    id: str
+    name: str
+    area: str
+    frequency: str
+    xp_rules: ProgramXpRules
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Program":
+        return cls(
+            id=str(data["id"]),
+            name=str(data.get("name", "")),
+            area=str(data.get("area", "Mind")),
+            frequency=str(data.get("frequency", "daily")),
+            xp_rules=ProgramXpRules.from_dict(data),
+            created_at=_parse_datetime(data.get("createdAt")),
+            updated_at=_parse_datetime(data.get("updatedAt")),
+        )
+
+
+@dataclass(frozen=True)
+class ProgramRun:
+    id: str
+    program_id: str
+    user_id: str
+    completed: bool
+    quality_ratings: tuple[tuple[str, float], ...]
+    custom_rule_passed: bool
+    created_at: datetime
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ProgramRun":
+        ratings = data.get("qualityRatings") or {}
+        return cls(
+            id=str(data["id"]),
+            program_id=str(data["programId"]),
+            user_id=str(data.get("userId", "")),
+            completed=bool(data.get("completed", True)),
+            quality_ratings=tuple((str(key), float(value)) for key, value in ratings.items()),
+            custom_rule_passed=bool(data.get("customRulePassed", True)),
+            created_at=_parse_datetime(data.get("createdAt")),
+        )
+
+
+@dataclass(frozen=True)
+class ProgramStore:
+    version: int
+    programs: tuple[Program, ...]
+    runs: tuple[ProgramRun, ...]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ProgramStore":
+        return cls(
+            version=int(data.get("version", 1)),
+            programs=tuple(Program.from_dict(item) for item in data.get("programs", ())),
+            runs=tuple(ProgramRun.from_dict(item) for item in data.get("runs", ())),
+        )
+
+    def program_lookup(self) -> dict[str, Program]:
+        return {program.id: program for program in self.programs}
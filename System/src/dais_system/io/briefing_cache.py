@@ -0,0 +1,157 @@
+"""On-disk cache for rendered briefing JSON, shared across processes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import fields, is_dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from dais_system.io.json_store import BASE_DIR
+
+CACHE_DIR = BASE_DIR / ".cache" / "briefings"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+CACHE_SUFFIX = ".json"
+
+
+def file_fingerprint(path: str | Path) -> str:
+    """Identity of a store file from its metadata, without reading it.
+
+    Every write of the asset stores replaces the file, which moves ``st_mtime_ns``;
+    the size guards against filesystems with coarse timestamps.
+    """
+
+    target = Path(path)
+    try:
+        stat = target.stat()
+    except FileNotFoundError:
+        return f"{target}:missing"
+    return f"{target.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def store_fingerprint(store: object) -> str:
+    """Content hash of an in-memory store, fed record by record.
+
+    Only needed for stores that did not come from a file; prefer
+    ``file_fingerprint`` when the source path is known.
+
+    Frozen dataclasses have a stable repr; hashing each record separately keeps
+    memory flat instead of materialising one string for the whole store.
+    Derived fields (``compare=False``, e.g. prebuilt indexes) are skipped.
+    """
+
+    digest = hashlib.sha256(type(store).__name__.encode("utf-8"))
+    if not is_dataclass(store):
+        digest.update(repr(store).encode("utf-8"))
+        return digest.hexdigest()
+    for item in fields(store):
+        if not item.compare:
+            continue
+        value = getattr(store, item.name)
+        digest.update(b"\0" + item.name.encode("utf-8"))
+        records = value if isinstance(value, tuple) else (value,)
+        for record in records:
+            digest.update(b"\1" + repr(record).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def briefing_cache_key(
+    fingerprints: Iterable[str], target_date: date, settings: Mapping[str, Any]
+) -> str:
+    material = json.dumps(
+        {
+            "stores": list(fingerprints),
+            "target_date": target_date.isoformat(),
+            "settings": dict(settings),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class BriefingCache:
+    """Size-bounded LRU of briefing JSON files.
+
+    Writes go to a temporary file in the cache directory and are moved into
+    place with ``os.replace``, so concurrent readers in other processes see
+    either the complete old entry or the complete new one. A hit reads the
+    file once and bumps its modification time, which eviction orders by; that
+    keeps the order least-recently-used regardless of atime mount options.
+    """
+
+    def __init__(
+        self, directory: str | Path | None = None, *, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self._directory = Path(directory) if directory else CACHE_DIR
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:  # evicted by another process in the meantime
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self._directory, prefix=".tmp-", suffix=CACHE_SUFFIX)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(text)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._directory.glob(f"*{CACHE_SUFFIX}"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda item: item[0]):
+            if total <= self._max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        for path in self._directory.glob(f"*{CACHE_SUFFIX}"):
+            if path.name.startswith(".tmp-"):  # another process is still writing it
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,191 @@
+"""Streaming export of household entries and contact logs as flat rows."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+from dais_system.common.models import ContactLog, HouseholdEntry
+from dais_system.io.json_store import HOUSEHOLD_STORE_PATH, HUMAN_CONTACT_STORE_PATH
+from dais_system.io.json_stream import iter_array_items
+
+EXPORT_FORMATS = ("csv", "jsonl")
+EXPORT_COLUMNS = (
+    "kind",
+    "id",
+    "created_at",
+    "user_id",
+    "card_id",
+    "card_title",
+    "task_ids",
+    "task_labels",
+    "program_run_id",
+    "person_id",
+    "person_name",
+    "activity",
+    "note",
+)
+LIST_SEPARATOR = "|"
+
+
+@dataclass(frozen=True)
+class ExportFilter:
+    """Inclusive date range plus optional user filter.
+
+    Contact logs carry no user id, so ``user_id`` only narrows household entries.
+    """
+
+    since: date | None = None
+    until: date | None = None
+    user_id: str | None = None
+
+    def accepts_day(self, day: date) -> bool:
+        if self.since is not None and day < self.since:
+            return False
+        if self.until is not None and day > self.until:
+            return False
+        return True
+
+
+def iter_entry_rows(
+    path: str | Path | None = None, export_filter: ExportFilter | None = None
+) -> Iterator[dict[str, Any]]:
+    target = Path(path) if path else HOUSEHOLD_STORE_PATH
+    active = export_filter or ExportFilter()
+    task_labels = {
+        str(item["id"]): str(item.get("label", "")) for item in iter_array_items(target, "tasks")
+    }
+    card_titles = {
+        str(item["id"]): str(item.get("title", "")) for item in iter_array_items(target, "cards")
+    }
+
+    for item in iter_array_items(target, "entries"):
+        entry = HouseholdEntry.from_dict(item)
+        if active.user_id is not None and entry.user_id != active.user_id:
+            continue
+        if not active.accepts_day(entry.created_at.date()):
+            continue
+        snapshot = entry.card_snapshot
+        yield _row(
+            kind="household_entry",
+            id=entry.id,
+            created_at=entry.created_at.isoformat(),
+            user_id=entry.user_id,
+            card_id=entry.card_id,
+            card_title=card_titles.get(entry.card_id, snapshot.title if snapshot else ""),
+            task_ids=LIST_SEPARATOR.join(entry.completed_task_ids),
+            task_labels=LIST_SEPARATOR.join(
+                task_labels.get(task_id, "") for task_id in entry.completed_task_ids
+            ),
+            program_run_id=entry.program_run_id,
+            note=entry.note,
+        )
+
+
+def iter_log_rows(
+    path: str | Path | None = None, export_filter: ExportFilter | None = None
+) -> Iterator[dict[str, Any]]:
+    target = Path(path) if path else HUMAN_CONTACT_STORE_PATH
+    active = export_filter or ExportFilter()
+    person_names = {
+        str(item["id"]): str(item.get("name", "")) for item in iter_array_items(target, "persons")
+    }
+
+    for item in iter_array_items(target, "logs"):
+        log = ContactLog.from_dict(item)
+        if not active.accepts_day(log.created_at.date()):
+            continue
+        yield _row(
+            kind="contact_log",
+            id=log.id,
+            created_at=log.created_at.isoformat(),
+            person_id=log.person_id,
+            person_name=person_names.get(log.person_id, ""),
+            activity=log.activity,
+            note=log.note,
+        )
+
+
+def write_rows(rows: Iterable[dict[str, Any]], handle: TextIO, fmt: str = "csv") -> int:
+    """Write rows one at a time and return how many were written."""
+
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(handle, fieldnames=EXPORT_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            handle.write(json.dumps(row, ensure_ascii=False))
+            handle.write("\n")
+            count += 1
+    return count
+
+
+def export_history(
+    handle: TextIO,
+    *,
+    fmt: str = "csv",
+    household_path: str | Path | None = None,
+    contact_path: str | Path | None = None,
+    export_filter: ExportFilter | None = None,
+) -> int:
+    def rows() -> Iterator[dict[str, Any]]:
+        yield from iter_entry_rows(household_path, export_filter)
+        yield from iter_log_rows(contact_path, export_filter)
+
+    return write_rows(rows(), handle, fmt)
+
+
+def _row(**values: Any) -> dict[str, Any]:
+    return {column: values.get(column) for column in EXPORT_COLUMNS}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Export DAiS history as flat rows.")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    parser.add_argument("--output", type=Path, help="Target file (default: stdout)")
+    parser.add_argument("--household", type=Path, default=HOUSEHOLD_STORE_PATH)
+    parser.add_argument("--contacts", type=Path, default=HUMAN_CONTACT_STORE_PATH)
+    parser.add_argument("--since", type=date.fromisoformat)
+    parser.add_argument("--until", type=date.fromisoformat)
+    parser.add_argument("--user", dest="user_id")
+    args = parser.parse_args(argv)
+
+    export_filter = ExportFilter(since=args.since, until=args.until, user_id=args.user_id)
+    if args.output is None:
+        # csv writes its own \r\n; stop text-mode stdout from translating it again
+        if isinstance(sys.stdout, io.TextIOWrapper):
+            sys.stdout.reconfigure(newline="")
+        export_history(
+            sys.stdout,
+            fmt=args.format,
+            household_path=args.household,
+            contact_path=args.contacts,
+            export_filter=export_filter,
+        )
+        return
+    with args.output.open("w", encoding="utf-8", newline="") as handle:
+        export_history(
+            handle,
+            fmt=args.format,
+            household_path=args.household,
+            contact_path=args.contacts,
+            export_filter=export_filter,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,13 @@ import json
 from pathlib import Path
 from typing import Any
 
-from dais_system.common.models import HouseholdStore, HumanContactStore
+from dais_system.common.models import HouseholdStore, HumanContactStore, ProgramStore
 
 BASE_DIR = Path(__file__).resolve().parents[3]
 ASSETS_DIR = BASE_DIR / "assets"
 HOUSEHOLD_STORE_PATH = ASSETS_DIR / "household-store.json"
 HUMAN_CONTACT_STORE_PATH = ASSETS_DIR / "human-contact-store.json"
+PROGRAM_STORE_PATH = ASSETS_DIR / "program-store.json"
 
 
 def _load_json(path: Path) -> dict[str, Any]:
@@ -30,3 +31,7 @@ def load_human_contact_store(path: str | Path | None = None) -> HumanContactStor
     target = Path(path) if path else HUMAN_CONTACT_STORE_PATH
     return HumanContactStore.from_dict(_load_json(target))
 
+
+def load_program_store(path: str | Path | None = None) -> ProgramStore:
+    target = Path(path) if path else PROGRAM_STORE_PATH
+    return ProgramStore.from_dict(_load_json(target))
@@ -0,0 +1,127 @@
+"""Incremental reader for the top-level arrays of the JSON asset stores."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+# upper bound for a single undecoded value; keeps malformed input from pulling in the whole file
+DEFAULT_MAX_RECORD_SIZE = 16 * 1024 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _StreamCursor:
+    """Buffered cursor that decodes one JSON value at a time from a text stream."""
+
+    def __init__(self, handle: TextIO, chunk_size: int, max_record_size: int) -> None:
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._max_record_size = max_record_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._handle.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        self._buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON store")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON store, found {found!r}")
+        self._pos += 1
+
+    def consume_if(self, char: str) -> bool:
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # only a truncated value is worth more input; give up once it exceeds the cap
+                pending = len(self._buffer) - self._pos
+                if pending < self._max_record_size and self._fill():
+                    continue
+                raise
+            # a scalar ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.consume_if("]"):
+            return
+        while True:
+            yield self.decode()
+            if self.consume_if("]"):
+                return
+            self.expect(",")
+
+
+def iter_array_items(
+    path: str | Path,
+    key: str,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_record_size: int = DEFAULT_MAX_RECORD_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Yield the records of a top-level array one by one with bounded memory.
+
+    Other top-level arrays are skipped element by element, so even a huge
+    ``entries`` array in front of the requested key is never held in memory.
+    A value that does not decode within ``max_record_size`` characters raises
+    ``json.JSONDecodeError``.
+    """
+
+    target = Path(path)
+    if not target.exists():
+        raise FileNotFoundError(f"Store not found: {target}")
+    with target.open("r", encoding="utf-8") as handle:
+        cursor = _StreamCursor(handle, chunk_size, max_record_size)
+        cursor.expect("{")
+        if cursor.consume_if("}"):
+            return
+        while True:
+            name = cursor.decode()
+            cursor.expect(":")
+            if name == key:
+                if cursor.peek() == "[":
+                    yield from cursor.iter_array()
+                return
+            if cursor.peek() == "[":
+                for _ in cursor.iter_array():
+                    pass
+            else:
+                cursor.decode()
+            if cursor.consume_if("}"):
+                return
+            cursor.expect(",")
@@ -0,0 +1,332 @@
+"""Multi-process loader for large JSON stores.
+
+The big record array (``entries`` / ``logs``) is split speculatively at byte
+offsets that look like record boundaries: the separator and leading key seen
+between the first two records, so nested objects rarely match. Each worker
+memory-maps the file, parses its slice as ``[ ... ]`` and runs ``from_dict``
+on it, which is where nearly all of the serial load time goes.
+
+Built models are expensive to unpickle, so workers send back plain field
+tuples (strings, tuples, datetimes and a few interned card snapshots) plus a
+per-chunk latest-record index by position; the parent only calls the
+dataclass constructors. That constructor pass and the merge are the serial
+part of the load.
+
+A chunk that ends at a fake boundary (inside a string or a nested array) is
+unbalanced and fails to parse or to build models. The chunks after it are
+merged into it and re-parsed in-process until one ends at a real boundary, so
+a chunk lying entirely inside one nested array may parse fine but is never
+used on its own. Correctness never depends on the guess.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import re
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, Hashable, Mapping, Sequence
+
+from dais_system.common.models import (
+    ContactLog,
+    HouseholdCardSnapshot,
+    HouseholdEntry,
+    HouseholdStore,
+    HumanContactStore,
+)
+from dais_system.io.json_store import (
+    HOUSEHOLD_STORE_PATH,
+    HUMAN_CONTACT_STORE_PATH,
+    load_household_store,
+    load_human_contact_store,
+)
+
+# below this size the process start-up costs more than it saves
+MIN_PARALLEL_BYTES = 8 * 1024 * 1024
+CHUNKS_PER_WORKER = 4
+
+_SEPARATOR = re.compile(rb"\s*,\s*")
+_LEADING_KEY = re.compile(rb'\{\s*"(?:[^"\\]|\\.)*"')
+
+
+@dataclass(frozen=True)
+class _RecordSpec:
+    key: str
+    model: type
+    build: Callable[[Mapping[str, Any]], Any]
+    index_key: Callable[[Any], Hashable]
+
+    @property
+    def to_row(self) -> Callable[[Any], tuple[Any, ...]]:
+        return attrgetter(*(item.name for item in fields(self.model)))
+
+
+def _entry_index_key(entry: HouseholdEntry) -> Hashable:
+    return entry.card_id
+
+
+def _log_index_key(log: ContactLog) -> Hashable:
+    return (log.person_id, log.activity)
+
+
+_SPECS = {
+    "entries": _RecordSpec("entries", HouseholdEntry, HouseholdEntry.from_dict, _entry_index_key),
+    "logs": _RecordSpec("logs", ContactLog, ContactLog.from_dict, _log_index_key),
+}
+
+
+@dataclass(frozen=True)
+class _ChunkResult:
+    # model fields in declaration order; cheap to pickle, unlike the models themselves
+    rows: list[tuple[Any, ...]]
+    latest: dict[Hashable, int]
+    suffix: str | None
+
+
+def _parse_chunk(path: str, spec_key: str, start: int, end: int | None) -> _ChunkResult | None:
+    """Parse one slice; ``end=None`` reads through the array's closing bracket."""
+
+    spec = _SPECS[spec_key]
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        raw = mm[start:end] if end is not None else mm[start:]
+    try:
+        suffix: str | None = None
+        if end is None:
+            text = "[" + raw.decode("utf-8")
+            items, consumed = json.JSONDecoder().raw_decode(text)
+            suffix = text[consumed:]
+            # a fake start inside a nested array closes that array early; the rest is then
+            # not the tail of the top-level object and fails here (on the first extra byte)
+            json.loads('{"_":[]' + suffix)
+        else:
+            items = json.loads(b"[" + raw + b"]")
+        records = tuple(spec.build(item) for item in items)
+    except Exception:
+        # malformed slice or a fragment that is not a record: let the merge retry it
+        return None
+
+    if spec_key == "entries":
+        records = _intern_snapshots(records)
+    latest: dict[Hashable, int] = {}
+    for position, record in enumerate(records):
+        key = spec.index_key(record)
+        current = latest.get(key)
+        if current is None or record.created_at > records[current].created_at:
+            latest[key] = position
+    to_row = spec.to_row
+    return _ChunkResult(rows=[to_row(record) for record in records], latest=latest, suffix=suffix)
+
+
+def _intern_snapshots(entries: tuple[HouseholdEntry, ...]) -> tuple[HouseholdEntry, ...]:
+    # entries of one card mostly share an identical snapshot; sharing the object lets
+    # pickle send it once per chunk instead of once per entry
+    seen: dict[HouseholdCardSnapshot, HouseholdCardSnapshot] = {}
+    interned: list[HouseholdEntry] = []
+    for entry in entries:
+        snapshot = entry.card_snapshot
+        if snapshot is not None:
+            shared = seen.setdefault(snapshot, snapshot)
+            if shared is not snapshot:
+                entry = replace(entry, card_snapshot=shared)
+        interned.append(entry)
+    return tuple(interned)
+
+
+def _find_array(mm: mmap.mmap, key: str) -> int | None:
+    match = re.search(rb'(?<!\\)"' + key.encode("utf-8") + rb'"\s*:\s*\[', mm)
+    if match is None:
+        return None
+    start = match.end()
+    # skip to the first record so chunk 0 starts at a real boundary
+    while start < len(mm) and mm[start : start + 1] in b" \t\r\n":
+        start += 1
+    if mm[start : start + 1] != b"{":
+        return None
+    return start
+
+
+def _boundary_pattern(mm: mmap.mmap, start: int) -> re.Pattern[bytes] | None:
+    """Derive the ``}`` + separator + ``{"key"`` bytes between the first two records."""
+
+    decoder = json.JSONDecoder()
+    window = 4096
+    while True:
+        raw = mm[start : start + window]
+        try:
+            _, consumed = decoder.raw_decode(raw.decode("utf-8", errors="replace"))
+            break
+        except ValueError:
+            if start + window >= len(mm):
+                return None
+            window *= 2
+    first_end = start + len(raw.decode("utf-8", errors="replace")[:consumed].encode("utf-8"))
+    separator = _SEPARATOR.match(mm, first_end)
+    lead = _LEADING_KEY.match(mm, start)
+    if separator is None or lead is None or separator.end() == first_end:
+        return None
+    return re.compile(re.escape(b"}" + separator.group()) + b"(" + re.escape(lead.group()) + b")")
+
+
+def _split_points(
+    mm: mmap.mmap, start: int, chunks: int, boundary: re.Pattern[bytes]
+) -> list[tuple[int, int | None]]:
+    size = len(mm) - start
+    step = max(size // chunks, 1)
+    ranges: list[tuple[int, int | None]] = []
+    chunk_start = start
+    for index in range(1, chunks):
+        match = boundary.search(mm, max(start + index * step, chunk_start + 1))
+        if match is None:
+            break
+        ranges.append((chunk_start, match.start() + 1))
+        chunk_start = match.start(1)
+    ranges.append((chunk_start, None))
+    return ranges
+
+
+def _merge(
+    path: str, spec_key: str, ranges: Sequence[tuple[int, int | None]], results: list[Any]
+) -> tuple[list[Any], dict[Hashable, Any], str]:
+    model = _SPECS[spec_key].model
+    records: list[Any] = []
+    latest: dict[Hashable, Any] = {}
+    pending: int | None = None
+
+    def accept(result: _ChunkResult) -> None:
+        base = len(records)
+        records.extend(model(*row) for row in result.rows)
+        for key, position in result.latest.items():
+            record = records[base + position]
+            current = latest.get(key)
+            if current is None or record.created_at > current.created_at:
+                latest[key] = record
+
+    for (start, end), result in zip(ranges, results):
+        if pending is None and result is not None:
+            accept(result)
+            if result.suffix is not None:
+                return records, latest, result.suffix
+            continue
+        if pending is None:
+            pending = start
+        retried = _parse_chunk(path, spec_key, pending, end)
+        if retried is not None:
+            pending = None
+            accept(retried)
+            if retried.suffix is not None:
+                return records, latest, retried.suffix
+    raise ValueError(f"Could not parse '{spec_key}' array in {path}")
+
+
+def _load_parallel(
+    path: Path, spec_key: str, workers: int | None, executor: Executor | None
+) -> tuple[dict[str, Any], tuple[Any, ...], dict[Hashable, Any]] | None:
+    worker_count = workers or os.cpu_count() or 1
+    if workers is None and executor is None and worker_count < 2:
+        return None  # one core only adds the worker overhead on top of the serial parse
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        array_start = _find_array(mm, spec_key)
+        if array_start is None:
+            return None
+        boundary = _boundary_pattern(mm, array_start)
+        if boundary is None:
+            return None
+        ranges = _split_points(mm, array_start, worker_count * CHUNKS_PER_WORKER, boundary)
+        prefix = mm[:array_start].decode("utf-8")
+
+    target = str(path)
+    args = (
+        [target] * len(ranges),
+        [spec_key] * len(ranges),
+        [start for start, _ in ranges],
+        [end for _, end in ranges],
+    )
+    if executor is not None:
+        results = list(executor.map(_parse_chunk, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=worker_count) as pool:
+            results = list(pool.map(_parse_chunk, *args))
+
+    records, latest, suffix = _merge(target, spec_key, ranges, results)
+    # prefix ends just before the first record, so close the array and keep the rest
+    head = json.loads(prefix + "]" + suffix)
+    return head, tuple(records), latest
+
+
+def load_household_store_parallel(
+    path: str | Path | None = None,
+    *,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    min_parallel_bytes: int = MIN_PARALLEL_BYTES,
+) -> HouseholdStore:
+    """Load the household store across processes, with a prebuilt latest-entry index."""
+
+    target = Path(path) if path else HOUSEHOLD_STORE_PATH
+    if not target.exists():
+        raise FileNotFoundError(f"Store not found: {target}")
+    if target.stat().st_size < min_parallel_bytes:
+        return load_household_store(target)
+    loaded = _load_parallel(target, "entries", workers, executor)
+    if loaded is None:
+        return load_household_store(target)
+    head, entries, latest = loaded
+    store = HouseholdStore.from_dict(head)
+    return replace(store, entries=entries).with_latest_entries(latest)
+
+
+def load_human_contact_store_parallel(
+    path: str | Path | None = None,
+    *,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    min_parallel_bytes: int = MIN_PARALLEL_BYTES,
+) -> HumanContactStore:
+    """Load the human contact store across processes, with a prebuilt latest-log index."""
+
+    target = Path(path) if path else HUMAN_CONTACT_STORE_PATH
+    if not target.exists():
+        raise FileNotFoundError(f"Store not found: {target}")
+    if target.stat().st_size < min_parallel_bytes:
+        return load_human_contact_store(target)
+    loaded = _load_parallel(target, "logs", workers, executor)
+    if loaded is None:
+        return load_human_contact_store(target)
+    head, logs, latest = loaded
+    store = HumanContactStore.from_dict(head)
+    return replace(store, logs=logs).with_latest_logs(latest)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Time serial against parallel store loading.")
+    parser.add_argument("kind", choices=("household", "contacts"))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args(argv)
+
+    if args.kind == "household":
+        serial_load, parallel_load = load_household_store, load_household_store_parallel
+    else:
+        serial_load, parallel_load = load_human_contact_store, load_human_contact_store_parallel
+    started = time.perf_counter()
+    serial = serial_load(args.path)
+    serial_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    parallel = parallel_load(args.path, workers=args.workers, min_parallel_bytes=0)
+    parallel_seconds = time.perf_counter() - started
+    if parallel != serial:
+        raise SystemExit("parallel load differs from serial load")
+    print(
+        f"serial {serial_seconds:.2f}s, parallel {parallel_seconds:.2f}s "
+        f"({serial_seconds / parallel_seconds:.2f}x, {args.workers or os.cpu_count()} workers)"
+    )
+
+
+if __name__ == "__main__":
+    main()
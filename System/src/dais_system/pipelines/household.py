@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Iterable
 
-from dais_system.common.models import HouseholdCard, HouseholdStore, Task
+from dais_system.common.index import HouseholdIndex, build_household_index
+from dais_system.common.models import HouseholdCard, HouseholdStore
 
 DEFAULT_STALE_AFTER_DAYS = 7
 
@@ -64,19 +64,20 @@ def build_daily_briefing(
     reference_date: date | None = None,
     *,
     stale_after_days: int = DEFAULT_STALE_AFTER_DAYS,
+    index: HouseholdIndex | None = None,
 ) -> DailyBriefing:
     target_date = reference_date or date.today()
     weekday = target_date.isoweekday()
-    tasks_by_id = store.task_lookup()
+    store_index = index or build_household_index(store)
 
     focus_cards = tuple(
-        _build_card_briefing(card, store, tasks_by_id, target_date)
+        _build_card_briefing(card, store_index, target_date)
         for card in sorted(store.cards_for_weekday(weekday), key=lambda c: c.title)
     )
 
     overdue_cards = tuple(
-        _build_card_briefing(card, store, tasks_by_id, target_date)
-        for card in _overdue_candidates(store, weekday, target_date, stale_after_days)
+        _build_card_briefing(card, store_index, target_date)
+        for card in _overdue_candidates(store, store_index, weekday, target_date, stale_after_days)
     )
 
     stats = _build_stats(focus_cards)
@@ -93,15 +94,14 @@ def build_daily_briefing(
 
 def _build_card_briefing(
     card: HouseholdCard,
-    store: HouseholdStore,
-    tasks_by_id: dict[str, Task],
+    index: HouseholdIndex,
     target_date: date,
 ) -> CardBriefing:
-    entry = store.latest_entry_for_card(card.id)
+    entry = index.latest_entry_for_card(card.id)
     completed_task_ids = set(entry.completed_task_ids if entry else ())
     statuses = tuple(
         TaskStatus(task_id=task.id, label=task.label, completed=task.id in completed_task_ids)
-        for task in _tasks_for_card(card, tasks_by_id)
+        for task in index.tasks_for_card(card.id)
     )
 
     last_run_at = entry.created_at if entry else None
@@ -118,13 +118,6 @@ def _build_card_briefing(
     )
 
 
-def _tasks_for_card(card: HouseholdCard, tasks_by_id: dict[str, Task]) -> Iterable[Task]:
-    for task_id in card.task_ids:
-        task = tasks_by_id.get(task_id)
-        if task is not None:
-            yield task
-
-
 def _staleness_days(last_run_at: datetime | None, target_date: date) -> int | None:
     if last_run_at is None:
         return None
@@ -158,6 +151,7 @@ def _build_recommendations(stats: DailyStats, overdue_cards: tuple[CardBriefing,
 
 def _overdue_candidates(
     store: HouseholdStore,
+    index: HouseholdIndex,
     weekday: int,
     target_date: date,
     stale_after_days: int,
@@ -166,7 +160,7 @@ def _overdue_candidates(
     for card in store.cards:
         if card.weekday == weekday:
             continue
-        entry = store.latest_entry_for_card(card.id)
+        entry = index.latest_entry_for_card(card.id)
         last_run_at = entry.created_at if entry else None
         days = _staleness_days(last_run_at, target_date)
         if days is None or days >= stale_after_days:
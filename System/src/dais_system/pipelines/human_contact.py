@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from typing import Iterable
 
-from dais_system.common.models import HumanContactStore, Person
+from dais_system.common.index import ContactIndex, build_contact_index
+from dais_system.common.models import ContactAssignment, ContactLog, HumanContactStore, Person
 
 CADENCE_TO_DAYS = {
     "daily": 1,
@@ -16,6 +18,9 @@ CADENCE_TO_DAYS = {
     "monthly": 30,
     "quarterly": 90,
 }
+DEFAULT_CADENCE_DAYS = 7
+DEFAULT_PLAN_HORIZON_DAYS = 14
+DEFAULT_DAILY_CAPACITY = 5
 
 
 @dataclass(frozen=True)
@@ -54,12 +59,52 @@ class ContactRadar:
     summary: ContactSummary
 
 
+@dataclass(frozen=True)
+class PlannedContact:
+    assignment_id: str
+    person_id: str
+    name: str
+    activity: str
+    cadence: str
+    due_date: date
+    scheduled_for: date | None
+
+    @property
+    def delay_days(self) -> int | None:
+        if self.scheduled_for is None:
+            return None
+        return max((self.scheduled_for - self.due_date).days, 0)
+
+
+@dataclass(frozen=True)
+class ContactDayPlan:
+    day: date
+    contacts: tuple[PlannedContact, ...]
+
+
+@dataclass(frozen=True)
+class ContactSchedule:
+    start_date: date
+    horizon_days: int
+    daily_capacity: int
+    days: tuple[ContactDayPlan, ...]
+    backlog: tuple[PlannedContact, ...]
+
+    @property
+    def total_planned(self) -> int:
+        return sum(len(day.contacts) for day in self.days)
+
+
 def build_contact_radar(
-    store: HumanContactStore, reference_date: date | datetime | None = None
+    store: HumanContactStore,
+    reference_date: date | datetime | None = None,
+    *,
+    index: ContactIndex | None = None,
 ) -> ContactRadar:
     target_date = _normalize_date(reference_date)
-    persons = store.person_lookup()
-    statuses = tuple(_build_statuses(store, persons, target_date))
+    store_index = index or build_contact_index(store)
+    persons = store_index.persons_by_id
+    statuses = tuple(_build_statuses(store, store_index, target_date))
 
     overdue = tuple(sorted((s for s in statuses if s.due_in_days < 0), key=lambda s: s.due_in_days))
     due_today = tuple(sorted((s for s in statuses if s.due_in_days == 0), key=lambda s: s.name))
@@ -75,6 +120,97 @@ def build_contact_radar(
     return ContactRadar(overdue=overdue, due_today=due_today, upcoming=upcoming, summary=summary)
 
 
+def plan_contact_schedule(
+    store: HumanContactStore,
+    reference_date: date | datetime | None = None,
+    *,
+    horizon_days: int = DEFAULT_PLAN_HORIZON_DAYS,
+    daily_capacity: int = DEFAULT_DAILY_CAPACITY,
+    index: ContactIndex | None = None,
+) -> ContactSchedule:
+    """Spread due contacts over the horizon without exceeding the daily capacity.
+
+    Every assignment is projected forward from its last touch using its cadence.
+    A min-heap ordered by due date releases the most overdue contacts first; each
+    scheduled touch re-queues the assignment one cadence after the planned day.
+    Contacts that are due within the horizon but do not fit end up in ``backlog``
+    with ``scheduled_for=None``.
+    """
+
+    if horizon_days < 1:
+        raise ValueError("horizon_days must be at least 1")
+    if daily_capacity < 1:
+        raise ValueError("daily_capacity must be at least 1")
+
+    start = _normalize_date(reference_date)
+    start_ordinal = start.toordinal()
+    end_ordinal = start_ordinal + horizon_days
+    store_index = index or build_contact_index(store)
+
+    assignments: list[tuple[ContactAssignment, Person, int]] = []
+    queue: list[tuple[int, str, str, int]] = []
+    for assignment in store.assignments:
+        person = store_index.assignment_persons.get(assignment.id)
+        if person is None:
+            continue
+        cadence_days = CADENCE_TO_DAYS.get(assignment.cadence, DEFAULT_CADENCE_DAYS)
+        last_log = store_index.latest_log_for(assignment.person_id, assignment.activity)
+        due = _next_due(assignment, last_log, cadence_days).toordinal()
+        if due < end_ordinal:
+            queue.append((due, person.name, assignment.activity, len(assignments)))
+        assignments.append((assignment, person, cadence_days))
+    heapq.heapify(queue)
+
+    dates = {ordinal: date.fromordinal(ordinal) for ordinal in range(start_ordinal, end_ordinal)}
+    days: list[ContactDayPlan] = []
+    for day_ordinal in range(start_ordinal, end_ordinal):
+        day = dates[day_ordinal]
+        planned: list[PlannedContact] = []
+        while queue and queue[0][0] <= day_ordinal and len(planned) < daily_capacity:
+            due, name, activity, index = heapq.heappop(queue)
+            assignment, person, cadence_days = assignments[index]
+            due_date = dates.get(due) or date.fromordinal(due)
+            planned.append(_planned_contact(assignment, person, due_date, day))
+            next_due = day_ordinal + cadence_days
+            if next_due < end_ordinal:
+                heapq.heappush(queue, (next_due, name, activity, index))
+        days.append(ContactDayPlan(day=day, contacts=tuple(planned)))
+
+    backlog: list[PlannedContact] = []
+    for due, _, _, index in sorted(queue):
+        assignment, person, _ = assignments[index]
+        backlog.append(_planned_contact(assignment, person, date.fromordinal(due), None))
+
+    return ContactSchedule(
+        start_date=start,
+        horizon_days=horizon_days,
+        daily_capacity=daily_capacity,
+        days=tuple(days),
+        backlog=tuple(backlog),
+    )
+
+
+def _planned_contact(
+    assignment: ContactAssignment, person: Person, due_date: date, scheduled_for: date | None
+) -> PlannedContact:
+    return PlannedContact(
+        assignment_id=assignment.id,
+        person_id=person.id,
+        name=person.name,
+        activity=assignment.activity,
+        cadence=assignment.cadence,
+        due_date=due_date,
+        scheduled_for=scheduled_for,
+    )
+
+
+def _next_due(
+    assignment: ContactAssignment, last_log: ContactLog | None, cadence_days: int
+) -> date:
+    base = last_log.created_at.date() if last_log else assignment.created_at.date()
+    return base + timedelta(days=cadence_days)
+
+
 def _normalize_date(reference_date: date | datetime | None) -> date:
     if reference_date is None:
         return date.today()
@@ -84,16 +220,15 @@ def _normalize_date(reference_date: date | datetime | None) -> date:
 
 
 def _build_statuses(
-    store: HumanContactStore, persons: dict[str, Person], target_date: date
+    store: HumanContactStore, index: ContactIndex, target_date: date
 ) -> Iterable[ContactStatus]:
     for assignment in store.assignments:
-        person = persons.get(assignment.person_id)
+        person = index.assignment_persons.get(assignment.id)
         if person is None:
             continue
-        last_log = store.latest_log_for(assignment.person_id, assignment.activity)
-        cadence_days = CADENCE_TO_DAYS.get(assignment.cadence, 7)
-        base = last_log.created_at.date() if last_log else assignment.created_at.date()
-        next_due = base + timedelta(days=cadence_days)
+        last_log = index.latest_log_for(assignment.person_id, assignment.activity)
+        cadence_days = CADENCE_TO_DAYS.get(assignment.cadence, DEFAULT_CADENCE_DAYS)
+        next_due = _next_due(assignment, last_log, cadence_days)
         due_in_days = (next_due - target_date).days
         yield ContactStatus(
             person_id=person.id,
@@ -0,0 +1,153 @@
+"""XP aggregation for program runs."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+from dais_system.common.models import Program, ProgramRun, ProgramStore
+
+XP_AREAS = ("Mind", "Body", "Human", "Environment", "Business")
+
+
+@dataclass(frozen=True)
+class XpSummary:
+    area_totals: tuple[tuple[str, int], ...]
+    total_xp: int
+    daily_score: int
+    weekly_score: int
+    current_streak_days: int
+    longest_streak_days: int
+    total_runs: int
+    rewarded_runs: int
+
+
+def evaluate_run_xp(program: Program, run: ProgramRun) -> int:
+    """Apply the program's XP conditions to a single run."""
+
+    rules = program.xp_rules
+    if rules.require_completion and not run.completed:
+        return 0
+    if rules.min_quality_score is not None and run.quality_ratings:
+        average = sum(value for _, value in run.quality_ratings) / len(run.quality_ratings)
+        if average < rules.min_quality_score:
+            return 0
+    if rules.require_custom_rule and not run.custom_rule_passed:
+        return 0
+    return rules.base_value
+
+
+def distribute_xp(program: Program, amount: int) -> tuple[tuple[str, int], ...]:
+    """Split XP across areas; rounding leftovers go to the first area."""
+
+    distribution = program.xp_rules.distribution or ((program.area, 100),)
+    # Math.round semantics (halves round up), as in program-run-service.ts
+    shares = [
+        (area, math.floor(amount * percentage / 100 + 0.5)) for area, percentage in distribution
+    ]
+    remainder = amount - sum(share for _, share in shares)
+    if shares and remainder:
+        area, share = shares[0]
+        shares[0] = (area, share + remainder)
+    return tuple((area, share) for area, share in shares if share > 0)
+
+
+class XpLedger:
+    """Per-day XP aggregates that can be built in one pass and updated per run."""
+
+    def __init__(self, programs: Iterable[Program]) -> None:
+        self._programs = {program.id: program for program in programs}
+        # everything is kept per day so a summary only counts runs up to its reference date
+        self._daily_areas: dict[date, dict[str, int]] = {}
+        self._daily_xp: dict[date, int] = {}
+        self._daily_runs: dict[date, int] = {}
+        self._daily_rewarded: dict[date, int] = {}
+
+    @classmethod
+    def from_store(cls, store: ProgramStore) -> "XpLedger":
+        ledger = cls(store.programs)
+        for run in store.runs:
+            ledger.add_run(run)
+        return ledger
+
+    def add_run(self, run: ProgramRun) -> int:
+        """Fold a run into the aggregates and return the XP it earned."""
+
+        program = self._programs.get(run.program_id)
+        if program is None:
+            return 0
+        day = run.created_at.date()
+        self._daily_runs[day] = self._daily_runs.get(day, 0) + 1
+        earned = evaluate_run_xp(program, run)
+        if earned <= 0:
+            return 0
+        self._daily_rewarded[day] = self._daily_rewarded.get(day, 0) + 1
+        areas = self._daily_areas.setdefault(day, {})
+        for area, amount in distribute_xp(program, earned):
+            areas[area] = areas.get(area, 0) + amount
+        self._daily_xp[day] = self._daily_xp.get(day, 0) + earned
+        return earned
+
+    def summary(self, reference_date: date | datetime | None = None) -> XpSummary:
+        target = _normalize_date(reference_date)
+        week_start = target - timedelta(days=target.isoweekday() - 1)
+        weekly = sum(
+            self._daily_xp.get(week_start + timedelta(days=offset), 0)
+            for offset in range((target - week_start).days + 1)
+        )
+        area_totals = {area: 0 for area in XP_AREAS}
+        for day, areas in self._daily_areas.items():
+            if day <= target:
+                for area, amount in areas.items():
+                    area_totals[area] = area_totals.get(area, 0) + amount
+        return XpSummary(
+            area_totals=tuple(area_totals.items()),
+            total_xp=sum(area_totals.values()),
+            daily_score=self._daily_xp.get(target, 0),
+            weekly_score=weekly,
+            current_streak_days=self._current_streak(target),
+            longest_streak_days=self._longest_streak(target),
+            total_runs=_count_until(self._daily_runs, target),
+            rewarded_runs=_count_until(self._daily_rewarded, target),
+        )
+
+    def _current_streak(self, target: date) -> int:
+        # an empty target day does not break the streak until the day is over
+        day = target if target in self._daily_xp else target - timedelta(days=1)
+        streak = 0
+        while day in self._daily_xp:
+            streak += 1
+            day -= timedelta(days=1)
+        return streak
+
+    def _longest_streak(self, target: date) -> int:
+        longest = 0
+        for day in self._daily_xp:
+            if day > target or day - timedelta(days=1) in self._daily_xp:
+                continue
+            length = 0
+            while day <= target and day in self._daily_xp:
+                length += 1
+                day += timedelta(days=1)
+            longest = max(longest, length)
+        return longest
+
+
+def build_xp_summary(
+    store: ProgramStore, reference_date: date | datetime | None = None
+) -> XpSummary:
+    return XpLedger.from_store(store).summary(reference_date)
+
+
+def _count_until(counts: dict[date, int], target: date) -> int:
+    return sum(count for day, count in counts.items() if day <= target)
+
+
+def _normalize_date(reference_date: date | datetime | None) -> date:
+    if reference_date is None:
+        return date.today()
+    if isinstance(reference_date, datetime):
+        return reference_date.date()
+    return reference_date
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import copy
+import json
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from dais_system.agents.changefeed import diff_briefings
+from dais_system.agents.coordinator import DailyOperationsAgent
+from dais_system.io.briefing_cache import BriefingCache
+from dais_system.common.models import ProgramRun
+
+
+def test_identical_briefings_produce_empty_diff(
+    sample_household_store, sample_human_contact_store
+) -> None:
+    agent = DailyOperationsAgent(sample_household_store, sample_human_contact_store)
+    payload = agent.generate_briefing(date(2025, 1, 6)).to_dict()
+    diff = diff_briefings(payload, copy.deepcopy(payload))
+    assert diff.is_empty
+    # only the version id moved: nothing the client could apply
+    assert diff_briefings(payload, dict(payload, version_id="other")).is_empty
+    assert diff.focus_cards.is_empty
+    assert diff.stats_deltas == {}
+    assert diff.integrity is None
+
+
+def test_diff_reports_task_flip_and_status_change(
+    sample_household_store, sample_human_contact_store
+) -> None:
+    agent = DailyOperationsAgent(sample_household_store, sample_human_contact_store)
+    previous = agent.generate_briefing(date(2025, 1, 6)).to_dict()
+    current = copy.deepcopy(previous)
+    card = current["household"]["focus_cards"][0]
+    card["tasks"][1]["completed"] = True
+    current["household"]["stats"]["completed_tasks"] += 1
+    ben = current["human_contacts"]["due_today"][0]
+    ben["status"] = "upcoming"
+    current.pop("version_id")
+
+    current["integrity"]["orphaned_log_count"] = 1
+    current["integrity"]["orphaned_log_ids"] = ["log-ghost"]
+
+    diff = diff_briefings(previous, current)
+    assert not diff.is_empty
+    assert diff.integrity is not None and diff.integrity["orphaned_log_ids"] == ["log-ghost"]
+    assert [flip.task_id for flip in diff.task_flips] == ["task-floor"]
+    assert [c["card_id"] for c in diff.focus_cards.changed] == [card["card_id"]]
+    assert diff.stats_deltas == {"completed_tasks": 1}
+    assert diff.contact_status_changes[0].person_id == "person-ben"
+    assert diff.contact_status_changes[0].status == "upcoming"
+
+
+def test_agent_diff_since_known_version(sample_household_store, sample_human_contact_store) -> None:
+    agent = DailyOperationsAgent(sample_household_store, sample_human_contact_store)
+    served = json.loads(agent.generate_briefing_json(date(2025, 1, 6)))
+    diff = agent.generate_briefing_diff(served["version_id"], date(2025, 1, 6))
+    assert diff is not None and diff.is_empty
+    assert agent.generate_briefing_diff("unknown", date(2025, 1, 6)) is None
+
+
+def test_diff_reports_target_date(sample_household_store, sample_human_contact_store) -> None:
+    agent = DailyOperationsAgent(sample_household_store, sample_human_contact_store)
+    monday = agent.generate_briefing(date(2025, 1, 6)).to_dict()
+    tuesday = agent.generate_briefing(date(2025, 1, 7)).to_dict()
+    diff = diff_briefings(monday, tuesday)
+    assert not diff.is_empty
+    assert diff.target_date == "2025-01-07"
+
+
+def test_served_version_survives_across_agents(
+    tmp_path: Path, sample_household_store, sample_human_contact_store
+) -> None:
+    cache = BriefingCache(tmp_path)
+    first = DailyOperationsAgent(sample_household_store, sample_human_contact_store, cache=cache)
+    served = json.loads(first.generate_briefing_json(date(2025, 1, 6)))
+
+    # a fresh agent stands in for the next CLI invocation
+    second = DailyOperationsAgent(sample_household_store, sample_human_contact_store, cache=cache)
+    diff = second.generate_briefing_diff(served["version_id"], date(2025, 1, 7))
+    assert diff is not None and diff.target_date == "2025-01-07"
+
+    third = DailyOperationsAgent(sample_household_store, sample_human_contact_store, cache=cache)
+    follow_up = third.generate_briefing_diff(diff.to_version, date(2025, 1, 7))
+    assert follow_up is not None and follow_up.is_empty
+
+
+def test_agent_diff_reports_xp_deltas(
+    sample_household_store, sample_human_contact_store, sample_program_store
+) -> None:
+    agent = DailyOperationsAgent(
+        sample_household_store, sample_human_contact_store, sample_program_store
+    )
+    served = json.loads(agent.generate_briefing_json(date(2025, 1, 6)))
+    agent.record_program_run(
+        ProgramRun(
+            id="run-family-0106-done",
+            program_id="program-family-call",
+            user_id="demo-user",
+            completed=True,
+            quality_ratings=(),
+            custom_rule_passed=True,
+            created_at=datetime(2025, 1, 6, 19, tzinfo=timezone.utc),
+        )
+    )
+    diff = agent.generate_briefing_diff(served["version_id"], date(2025, 1, 6))
+    assert diff is not None and not diff.is_empty
+    assert diff.xp_deltas["area.Human"] == 50
+    assert diff.xp_deltas["daily_score"] == 50
+    assert diff.xp_deltas["current_streak_days"] == 1
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import date
 
-from dais_system.agents.coordinator import DailyOperationsAgent
+from dais_system.agents.coordinator import INTEGRITY_SAMPLE_SIZE, DailyOperationsAgent
 
 
 def test_agent_serialization(sample_household_store, sample_human_contact_store) -> None:
@@ -11,4 +12,29 @@ def test_agent_serialization(sample_household_store, sample_human_contact_store)
     assert payload["household"]["stats"]["total_tasks"] == 2
     assert payload["human_contacts"]["summary"]["total_people"] == 4
     assert "T" in payload["generated_at"]
+    assert payload["integrity"]["is_clean"] is True
 
+
+def test_agent_includes_xp_section(
+    sample_household_store, sample_human_contact_store, sample_program_store
+) -> None:
+    agent = DailyOperationsAgent(
+        sample_household_store, sample_human_contact_store, sample_program_store
+    )
+    payload = agent.generate_briefing(date(2025, 1, 6)).to_dict()
+    assert payload["xp"]["total_xp"] == 200
+    assert payload["xp"]["area_totals"]["Mind"] == 140
+
+
+def test_integrity_section_is_bounded(sample_household_store, sample_human_contact_store) -> None:
+    entry = sample_household_store.entries[0]
+    history = tuple(
+        replace(entry, id=f"entry-{index}", completed_task_ids=("task-gone",))
+        for index in range(INTEGRITY_SAMPLE_SIZE * 3)
+    )
+    store = replace(sample_household_store, entries=sample_household_store.entries + history)
+    agent = DailyOperationsAgent(store, sample_human_contact_store)
+    integrity = agent.generate_briefing(date(2025, 1, 6)).to_dict()["integrity"]
+    assert integrity["dangling_reference_count"] == INTEGRITY_SAMPLE_SIZE * 3
+    assert len(integrity["dangling_references"]) == INTEGRITY_SAMPLE_SIZE
+    assert len(agent.integrity_report.dangling_references) == INTEGRITY_SAMPLE_SIZE * 3
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date
+
+from dais_system.common.index import build_contact_index, build_household_index
+from dais_system.common.models import (
+    ContactAssignment,
+    ContactLog,
+    HouseholdCard,
+    HouseholdCardSnapshot,
+)
+from dais_system.pipelines.human_contact import build_contact_radar
+
+
+def test_clean_fixtures_have_clean_report(
+    sample_household_store, sample_human_contact_store
+) -> None:
+    household = build_household_index(sample_household_store)
+    contacts = build_contact_index(sample_human_contact_store)
+    assert household.report.merge(contacts.report).is_clean
+    assert [task.id for task in household.tasks_for_card("card-monday-reset")] == [
+        "task-dishes",
+        "task-floor",
+    ]
+    assert household.entry_cards["entry-monday"].id == "card-monday-reset"
+    assert contacts.assignment_persons["assign-ben-daily"].name == "Ben"
+
+
+def test_dangling_references_are_reported(
+    sample_household_store, sample_human_contact_store
+) -> None:
+    card = sample_household_store.cards[0]
+    broken_card = HouseholdCard.from_dict(
+        {"id": card.id, "title": card.title, "taskIds": [*card.task_ids, "task-gone"]}
+    )
+    orphan = replace(sample_household_store.entries[0], id="entry-orphan", card_id="card-gone")
+    household = replace(
+        sample_household_store,
+        cards=(broken_card, *sample_household_store.cards[1:]),
+        entries=(*sample_household_store.entries, orphan),
+    )
+    report = build_household_index(household).report
+    assert [(ref.source, ref.missing_id) for ref in report.dangling_references] == [
+        ("card", "task-gone")
+    ]
+    assert report.orphaned_entry_ids == ("entry-orphan",)
+
+    contact_store = replace(
+        sample_human_contact_store,
+        assignments=(
+            *sample_human_contact_store.assignments,
+            ContactAssignment.from_dict({"id": "assign-ghost", "personId": "person-ghost"}),
+        ),
+        logs=(
+            *sample_human_contact_store.logs,
+            ContactLog.from_dict({"id": "log-ghost", "personId": "person-ghost"}),
+        ),
+    )
+    index = build_contact_index(contact_store)
+    assert index.report.dangling_references[0].source_id == "assign-ghost"
+    assert index.report.orphaned_log_ids == ("log-ghost",)
+    radar = build_contact_radar(contact_store, date(2025, 1, 6), index=index)
+    assert radar.summary.total_people == 4
+
+
+def test_deleted_task_resolved_by_snapshot_is_not_dangling(sample_household_store) -> None:
+    entry = sample_household_store.entries[0]
+    snapshot = HouseholdCardSnapshot.from_dict(
+        {"id": entry.card_id, "tasks": [{"task": {"id": "task-deleted", "label": "Old"}}]}
+    )
+    kept = replace(
+        entry, id="entry-kept", completed_task_ids=("task-deleted",), card_snapshot=snapshot
+    )
+    lost = replace(kept, id="entry-lost", card_snapshot=None)
+    household = replace(
+        sample_household_store, entries=(*sample_household_store.entries, kept, lost)
+    )
+    report = build_household_index(household).report
+    assert [ref.source_id for ref in report.dangling_references] == ["entry-lost"]
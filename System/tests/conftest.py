@@ -6,8 +6,12 @@ from pathlib import Path
 
 import pytest
 
-from dais_system.common.models import HouseholdStore, HumanContactStore
-from dais_system.io.json_store import load_household_store, load_human_contact_store
+from dais_system.common.models import HouseholdStore, HumanContactStore, ProgramStore
+from dais_system.io.json_store import (
+    load_household_store,
+    load_human_contact_store,
+    load_program_store,
+)
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -22,6 +26,11 @@ def human_contact_fixture_path() -> Path:
     return FIXTURES_DIR / "human-contact-store.json"
 
 
+@pytest.fixture(scope="session")
+def program_fixture_path() -> Path:
+    return FIXTURES_DIR / "program-store.json"
+
+
 @pytest.fixture()
 def sample_household_store(household_fixture_path: Path) -> HouseholdStore:
     return load_household_store(household_fixture_path)
@@ -31,3 +40,7 @@ def sample_household_store(household_fixture_path: Path) -> HouseholdStore:
 def sample_human_contact_store(human_contact_fixture_path: Path) -> HumanContactStore:
     return load_human_contact_store(human_contact_fixture_path)
 
+
+@pytest.fixture()
+def sample_program_store(program_fixture_path: Path) -> ProgramStore:
+    return load_program_store(program_fixture_path)
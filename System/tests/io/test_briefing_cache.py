@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from dataclasses import replace
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from dais_system.agents import coordinator
+from dais_system.agents.coordinator import DailyOperationsAgent, cached_briefing_json
+from dais_system.io.briefing_cache import BriefingCache, file_fingerprint, store_fingerprint
+
+
+def test_cache_roundtrip_and_lru_eviction(tmp_path: Path) -> None:
+    cache = BriefingCache(tmp_path, max_bytes=25)
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    os.utime(tmp_path / "a.json", (1, 1))
+    os.utime(tmp_path / "b.json", (2, 2))
+    assert cache.get("a") == "x" * 10  # written first, read most recently
+    cache.put("c", "z" * 10)
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 10
+    assert cache.get("c") == "z" * 10
+    assert not list(tmp_path.glob(".tmp-*"))
+
+
+def test_clear_keeps_in_flight_writes(tmp_path: Path) -> None:
+    cache = BriefingCache(tmp_path)
+    cache.put("a", "x")
+    in_flight = tmp_path / ".tmp-other.json"
+    in_flight.write_text("partial", encoding="utf-8")
+    cache.clear()
+    assert cache.get("a") is None
+    assert in_flight.exists()
+
+
+def test_fingerprint_ignores_prebuilt_index(sample_household_store) -> None:
+    indexed = sample_household_store.with_latest_entries({})
+    assert store_fingerprint(indexed) == store_fingerprint(sample_household_store)
+    changed = replace(sample_household_store, entries=sample_household_store.entries[:1])
+    assert store_fingerprint(changed) != store_fingerprint(sample_household_store)
+
+
+def test_agent_serves_cached_briefing(
+    tmp_path: Path, sample_household_store, sample_human_contact_store
+) -> None:
+    cache = BriefingCache(tmp_path)
+    agent = DailyOperationsAgent(sample_household_store, sample_human_contact_store, cache=cache)
+    first = agent.generate_briefing_json(date(2025, 1, 6))
+    payload = json.loads(first)
+    assert payload["cached_at"] >= payload["generated_at"]
+
+    other = DailyOperationsAgent(sample_household_store, sample_human_contact_store, cache=cache)
+    assert other.generate_briefing_json(date(2025, 1, 6)) == first
+    assert other.generate_briefing_diff(payload["version_id"], date(2025, 1, 6)) is not None
+    assert other.generate_briefing_json(date(2025, 1, 7)) != first
+    assert len(list(tmp_path.glob("*.json"))) == 4  # keyed entry + served version per date
+
+
+def test_cached_briefing_skips_loading_on_hit(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    household_fixture_path: Path,
+    human_contact_fixture_path: Path,
+    program_fixture_path: Path,
+) -> None:
+    for name, source in (
+        ("HOUSEHOLD_STORE_PATH", household_fixture_path),
+        ("HUMAN_CONTACT_STORE_PATH", human_contact_fixture_path),
+        ("PROGRAM_STORE_PATH", program_fixture_path),
+    ):
+        target = tmp_path / "assets" / source.name
+        target.parent.mkdir(exist_ok=True)
+        shutil.copy(source, target)
+        monkeypatch.setattr(coordinator, name, target)
+    cache = BriefingCache(tmp_path / "cache")
+    first = cached_briefing_json(cache, date(2025, 1, 6))
+
+    def fail(*_: object) -> None:
+        raise AssertionError("stores loaded on a cache hit")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(coordinator, "load_household_store", fail)
+        assert cached_briefing_json(cache, date(2025, 1, 6)) == first
+
+    household = coordinator.HOUSEHOLD_STORE_PATH
+    before = file_fingerprint(household)
+    os.utime(household, ns=(1, 1))
+    assert file_fingerprint(household) != before
+    assert cached_briefing_json(cache, date(2025, 1, 6)) != first
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from dais_system.io.export import ExportFilter, export_history, iter_entry_rows
+from dais_system.io.json_stream import iter_array_items
+
+
+def test_stream_matches_json_load(household_fixture_path: Path) -> None:
+    expected = json.loads(household_fixture_path.read_text(encoding="utf-8"))
+    for key in ("tasks", "cards", "entries"):
+        streamed = list(iter_array_items(household_fixture_path, key, chunk_size=7))
+        assert streamed == expected[key]
+    assert list(iter_array_items(household_fixture_path, "missing")) == []
+
+
+def test_entry_rows_join_lookups(household_fixture_path: Path) -> None:
+    rows = list(iter_entry_rows(household_fixture_path))
+    monday = next(row for row in rows if row["id"] == "entry-monday")
+    assert monday["card_title"] == "Monday reset"
+    assert monday["task_labels"] == "Dishwasher"
+
+
+def test_export_csv_and_filters(
+    household_fixture_path: Path, human_contact_fixture_path: Path
+) -> None:
+    buffer = io.StringIO()
+    count = export_history(
+        buffer,
+        household_path=household_fixture_path,
+        contact_path=human_contact_fixture_path,
+        export_filter=ExportFilter(since=date(2025, 1, 1)),
+    )
+    rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+    assert len(rows) == count
+    assert {row["kind"] for row in rows} == {"household_entry", "contact_log"}
+    assert all(row["created_at"] >= "2025-01-01" for row in rows)
+    assert "log-dora" not in {row["id"] for row in rows}
+
+
+def test_export_jsonl_user_filter(
+    household_fixture_path: Path, human_contact_fixture_path: Path
+) -> None:
+    buffer = io.StringIO()
+    export_history(
+        buffer,
+        fmt="jsonl",
+        household_path=household_fixture_path,
+        contact_path=human_contact_fixture_path,
+        export_filter=ExportFilter(user_id="nobody"),
+    )
+    rows = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert rows and all(row["kind"] == "contact_log" for row in rows)
+
+
+def test_stream_bounds_buffer_on_malformed_record(tmp_path: Path) -> None:
+    target = tmp_path / "broken.json"
+    target.write_text(
+        '{"entries": [{"id": "ok"}, {"id": broken}, ' + '{"id": "x"}, ' * 5000 + "{}]}",
+        encoding="utf-8",
+    )
+    items = iter_array_items(target, "entries", chunk_size=64, max_record_size=256)
+    assert next(items) == {"id": "ok"}
+    with pytest.raises(json.JSONDecodeError):
+        next(items)
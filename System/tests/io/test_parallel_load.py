@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from dais_system.io.json_store import load_household_store, load_human_contact_store
+from dais_system.io.parallel_load import (
+    load_household_store_parallel,
+    load_human_contact_store_parallel,
+)
+
+
+def _grow(source: Path, target: Path, key: str, copies: int) -> None:
+    data = json.loads(source.read_text(encoding="utf-8"))
+    template = data[key]
+    records = []
+    for index in range(copies):
+        for item in template:
+            record = dict(item, id=f"{item['id']}-{index}")
+            # notes that look like record boundaries must not confuse the splitter
+            record["note"] = f'Grüße }}, {{ "entries": [ #{index}'
+            records.append(record)
+    if key == "entries":
+        records[0]["cardSnapshot"] = {
+            "id": "snap",
+            "tasks": [{"taskId": "a", "order": 0}, {"taskId": "b", "order": 1}],
+        }
+    data[key] = records
+    target.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def test_parallel_household_matches_serial(tmp_path: Path, household_fixture_path: Path) -> None:
+    target = tmp_path / "household-store.json"
+    _grow(household_fixture_path, target, "entries", 200)
+    serial = load_household_store(target)
+    parallel = load_household_store_parallel(target, workers=3, min_parallel_bytes=0)
+    assert parallel == serial
+    assert parallel.latest_entries is not None
+    for card in serial.cards:
+        assert parallel.latest_entry_for_card(card.id) == serial.latest_entry_for_card(card.id)
+    # the prebuilt index must not survive a replace of the entries it describes
+    assert replace(parallel, entries=parallel.entries[:1]).latest_entries is None
+
+
+def test_parallel_contacts_matches_serial(
+    tmp_path: Path, human_contact_fixture_path: Path
+) -> None:
+    target = tmp_path / "human-contact-store.json"
+    _grow(human_contact_fixture_path, target, "logs", 150)
+    serial = load_human_contact_store(target)
+    parallel = load_human_contact_store_parallel(target, workers=2, min_parallel_bytes=0)
+    assert parallel == serial
+    assert parallel.latest_log_index() == serial.latest_log_index()
+
+
+def test_small_store_loads_serially(household_fixture_path: Path) -> None:
+    store = load_household_store_parallel(household_fixture_path)
+    assert store == load_household_store(household_fixture_path)
+    assert store.latest_entries is None
+
+
+def test_parallel_compact_store_with_nested_id_objects(
+    tmp_path: Path, human_contact_fixture_path: Path
+) -> None:
+    data = json.loads(human_contact_fixture_path.read_text(encoding="utf-8"))
+    template = {key: value for key, value in data["logs"][0].items() if key != "id"}
+    # compact separators plus id-first nested objects make the boundary match inside records
+    data["logs"] = [
+        {"id": f"log-{index}", "meta": [{"id": "x"}, {"id": "y"}], **template}
+        for index in range(1999)
+    ]
+    target = tmp_path / "human-contact-store.json"
+    target.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+    serial = load_human_contact_store(target)
+    for workers in (1, 2, 3, 4):
+        parallel = load_human_contact_store_parallel(
+            target, workers=workers, min_parallel_bytes=0
+        )
+        assert parallel == serial
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from dais_system.pipelines.human_contact import build_contact_radar
+from dais_system.pipelines.human_contact import build_contact_radar, plan_contact_schedule
 
 
 def test_contact_radar(sample_human_contact_store) -> None:
@@ -12,3 +12,27 @@ def test_contact_radar(sample_human_contact_store) -> None:
     assert any(status.person_id == "person-ben" for status in radar.due_today)
     assert any(status.person_id == "person-anna" for status in radar.upcoming)
 
+
+def test_contact_schedule_respects_capacity(sample_human_contact_store) -> None:
+    schedule = plan_contact_schedule(
+        sample_human_contact_store, date(2025, 1, 6), horizon_days=3, daily_capacity=1
+    )
+    assert len(schedule.days) == 3
+    assert all(len(day.contacts) <= 1 for day in schedule.days)
+    first = schedule.days[0].contacts[0]
+    assert first.person_id == "person-dora"
+    assert first.delay_days > 0
+    assert [c.person_id for c in schedule.backlog] == ["person-ben"]
+    assert schedule.backlog[0].scheduled_for is None
+    assert schedule.backlog[0].delay_days is None
+
+
+def test_contact_schedule_requeues_by_cadence(sample_human_contact_store) -> None:
+    schedule = plan_contact_schedule(
+        sample_human_contact_store, date(2025, 1, 6), horizon_days=7, daily_capacity=5
+    )
+    ben_days = [
+        day.day for day in schedule.days for c in day.contacts if c.person_id == "person-ben"
+    ]
+    assert len(ben_days) == 7
+    assert not schedule.backlog
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date, datetime, timezone
+
+from dais_system.common.models import ProgramRun
+from dais_system.pipelines.programs import XpLedger, build_xp_summary, distribute_xp
+
+
+def test_xp_summary(sample_program_store) -> None:
+    summary = build_xp_summary(sample_program_store, date(2025, 1, 6))
+    totals = dict(summary.area_totals)
+    assert totals["Mind"] == 140
+    assert totals["Body"] == 60
+    assert summary.total_xp == 200
+    assert summary.daily_score == 0
+    assert summary.weekly_score == 0
+    assert summary.current_streak_days == 2
+    assert summary.rewarded_runs == 2
+    assert summary.total_runs == 4
+
+
+def test_incremental_run_matches_rebuild(sample_program_store) -> None:
+    ledger = XpLedger.from_store(sample_program_store)
+    run = ProgramRun(
+        id="run-family-0106-done",
+        program_id="program-family-call",
+        user_id="demo-user",
+        completed=True,
+        quality_ratings=(),
+        custom_rule_passed=True,
+        created_at=datetime(2025, 1, 6, 19, tzinfo=timezone.utc),
+    )
+    assert ledger.add_run(run) == 50
+    summary = ledger.summary(date(2025, 1, 6))
+    assert dict(summary.area_totals)["Human"] == 50
+    assert summary.daily_score == 50
+    assert summary.current_streak_days == 3
+    assert summary.longest_streak_days == 3
+
+    rebuilt = XpLedger.from_store(
+        replace(sample_program_store, runs=sample_program_store.runs + (run,))
+    )
+    assert rebuilt.summary(date(2025, 1, 6)) == summary
+
+
+def test_summary_ignores_runs_after_reference_date(sample_program_store) -> None:
+    summary = build_xp_summary(sample_program_store, date(2025, 1, 4))
+    assert summary.total_xp == 100
+    assert dict(summary.area_totals)["Mind"] == 70
+    assert summary.total_runs == 1
+    assert summary.longest_streak_days == 1
+
+
+def test_distribution_rounds_halves_up(sample_program_store) -> None:
+    program = replace(
+        sample_program_store.programs[0],
+        xp_rules=replace(
+            sample_program_store.programs[0].xp_rules, distribution=(("Mind", 50), ("Body", 50))
+        ),
+    )
+    assert distribute_xp(program, 25) == (("Mind", 12), ("Body", 13))